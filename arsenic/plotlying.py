@@ -8,6 +8,19 @@ import seaborn as sns
 from . import stats
 
 
+def _dispatch_plotly(fig: go.Figure, filename: Union[str, None] = None):
+    """
+    Shows fig if filename is None, otherwise writes it as interactive html
+    or, for any other extension, as a static image.
+    """
+    if filename is None:
+        fig.show()
+    elif filename.endswith(".html"):
+        fig.write_html(filename)
+    else:
+        fig.write_image(filename)
+
+
 def plot_bar(
     df: pd.DataFrame,
     ddg_cols: str,
@@ -27,6 +40,8 @@ def plot_bar(
     used as y axis tick labels).
     """
 
+    assert len(ddg_cols) == len(error_cols), "Need one error column per DDG column"
+
     # create color palette
     colors = sns.color_palette(palette="bright")
 
@@ -34,25 +49,43 @@ def plot_bar(
     num_bars_per_edge = len(ddg_cols)
     height = 20 * (num_bars_per_edge + 0.3) * num_edges
     exp_size = height / num_edges / 2.0
-    alim = (
-        np.max(
-            np.fabs(df.loc[:, ddg_cols + [exp_col]].values)
-            + np.fabs(df.loc[:, error_cols + [exp_error_col]].values)
-        )
-        * 1.05
-    )
 
-    fig = go.Figure()
+    # pull all the numeric columns out of the DataFrame in one block, rather than once per trace,
+    # and slice them by position. The names are kept apart so the values stay float64
+    value_cols = list(ddg_cols) + list(error_cols)
+    if exp_col is not None:
+        value_cols += [exp_col, exp_error_col]
+    values = df[value_cols].to_numpy(dtype=np.float64)
+    ddg_mat = values[:, :num_bars_per_edge]
+    err_mat = values[:, num_bars_per_edge : 2 * num_bars_per_edge]
+    if exp_col is not None:
+        exp = values[:, -2]
+        dexp = values[:, -1]
+    names = df[name_col].to_numpy()
+
+    # reduce the bars and the experiment separately, rather than stacking them first
+    # accumulate |value| + |error| in place, to avoid a temporary for the sum
+    extent = np.abs(ddg_mat)
+    extent += np.abs(err_mat)
+    alim = extent.max()
+    if exp_col is not None:
+        exp_extent = np.abs(exp)
+        exp_extent += np.abs(dexp)
+        alim = max(alim, exp_extent.max())
+    alim *= 1.05
+
+    # collect the traces and construct the figure in one go at the end
+    traces = []
 
     # add data
-    for i, (col, ecol) in enumerate(zip(ddg_cols, error_cols)):
-        fig.add_trace(
+    for i, col in enumerate(ddg_cols):
+        traces.append(
             go.Bar(
-                x=df.loc[:, col].values,
-                y=df[name_col].values,
+                x=ddg_mat[:, i],
+                y=names,
                 error_x=dict(
                     type="data",  # value of error bar given in data coordinates
-                    array=df.loc[:, ecol].values,
+                    array=err_mat[:, i],
                     visible=True,
                 ),
                 name=col,
@@ -62,10 +95,11 @@ def plot_bar(
         )
 
     if exp_col is not None:
-        fig.add_trace(
+        # experimental value with its uncertainty drawn as error bar caps
+        traces.append(
             go.Scatter(
-                x=df.loc[:, exp_col].values,
-                y=df[name_col].values,
+                x=exp,
+                y=names,
                 name="experiment",
                 mode="markers",
                 marker=dict(
@@ -74,42 +108,18 @@ def plot_bar(
                     size=exp_size,
                     line_width=4,
                 ),
-            )
-        )
-
-        fig.add_trace(
-            go.Scatter(
-                x=df.loc[:, exp_col].values - df.loc[:, exp_error_col].values,
-                y=df[name_col].values,
-                name="ExpErrors1",
-                mode="markers",
-                marker=dict(
-                    symbol="line-ns",
-                    color="black",
-                    size=exp_size,
-                    line_width=2,
-                ),
-                showlegend=False,
-            )
-        )
-
-        fig.add_trace(
-            go.Scatter(
-                x=df.loc[:, exp_col].values + df.loc[:, exp_error_col].values,
-                y=df[name_col].values,
-                name="ExpErrors2",
-                mode="markers",
-                marker=dict(
-                    symbol="line-ns",
+                error_x=dict(
+                    type="data",  # value of error bar given in data coordinates
+                    array=dexp,
+                    visible=True,
                     color="black",
-                    size=exp_size,
-                    line_width=2,
+                    thickness=2,
+                    width=exp_size / 2.0,
                 ),
-                showlegend=False,
             )
         )
 
-    fig.update_layout(
+    layout = go.Layout(
         title=title,
         xaxis=dict(
             title=r"$\Delta\Delta G\, \mathrm{[kcal\,mol^{-1}]}$",
@@ -136,13 +146,9 @@ def plot_bar(
         bargap=0.3,  # gap between bars of adjacent location coordinates.
         bargroupgap=0.0,  # gap between bars of the same location coordinate.
     )
+    fig = go.Figure(data=traces, layout=layout)
 
-    if filename is None:
-        fig.show()
-    elif filename.find(".html"):
-        fig.write_html(filename)
-    else:
-        fig.write_image(filename)
+    _dispatch_plotly(fig, filename)
 
 
 def _master_plot(
@@ -160,15 +166,17 @@ def _master_plot(
     filename: Union[str, None] = None,
 ):
     nsamples = len(x)
-    ax_min = min(min(x), min(y)) - 0.5
-    ax_max = max(max(x), max(y)) + 0.5
+    ax_min = min(np.min(x), np.min(y)) - 0.5
+    ax_max = max(np.max(x), np.max(y)) + 0.5
 
-    fig = go.Figure()
+    # collect the traces and shapes and construct the figure in one go at the end
+    traces = []
+    shapes = []
 
     # x = 0 and y = 0 axes through origin
     if origins:
         # x=0
-        fig.add_trace(
+        traces.append(
             go.Scatter(
                 x=[0, 0],
                 y=[ax_min, ax_max],
@@ -178,7 +186,7 @@ def _master_plot(
             )
         )
         # y =0
-        fig.add_trace(
+        traces.append(
             go.Scatter(
                 x=[ax_min, ax_max],
                 y=[0, 0],
@@ -189,48 +197,26 @@ def _master_plot(
         )
     if guidelines:
         small_dist = 0.5
-        fig.add_trace(
-            go.Scatter(
-                x=[ax_min, ax_max, ax_max, ax_min],
-                y=[
-                    ax_min + 2.0 * small_dist,
-                    ax_max + 2.0 * small_dist,
-                    ax_max - 2.0 * small_dist,
-                    ax_min - 2.0 * small_dist,
-                ],
-                name="1 kcal/mol margin",
-                hoveron="points+fills",
-                hoverinfo="name",
-                fill="toself",
-                mode="lines",
-                line_width=0,
-                fillcolor="rgba(0, 0, 0, 0.2)",
-                showlegend=False,
+        # 1 and .5 kcal/mol margins, drawn as layout shapes rather than filled traces,
+        # so they overlap into two shades without the cost of two extra traces
+        for margin in [2.0 * small_dist, small_dist]:
+            shapes.append(
+                dict(
+                    type="path",
+                    path=(
+                        f"M {ax_min},{ax_min + margin} L {ax_max},{ax_max + margin} "
+                        f"L {ax_max},{ax_max - margin} L {ax_min},{ax_min - margin} Z"
+                    ),
+                    xref="x",
+                    yref="y",
+                    fillcolor="rgba(0, 0, 0, 0.2)",
+                    line_width=0,
+                    layer="below",
+                )
             )
-        )
-
-        fig.add_trace(
-            go.Scatter(
-                x=[ax_min, ax_max, ax_max, ax_min],
-                y=[
-                    ax_min + small_dist,
-                    ax_max + small_dist,
-                    ax_max - small_dist,
-                    ax_min - small_dist,
-                ],
-                name=".5 kcal/mol margin",
-                hoveron="points+fills",
-                hoverinfo="name",
-                fill="toself",
-                mode="lines",
-                line_width=0,
-                fillcolor="rgba(0, 0, 0, 0.2)",
-                showlegend=False,
-            )
-        )
 
     # diagonal
-    fig.add_trace(
+    traces.append(
         go.Scatter(
             x=[ax_min, ax_max],
             y=[ax_min, ax_max],
@@ -241,9 +227,10 @@ def _master_plot(
     )
 
     # 2.372 kcal / mol = 4 RT
-    clr = np.abs(x - y) / 2.372
+    clr = np.abs(x - y, dtype=np.float64)
+    clr /= 2.372
 
-    fig.add_trace(
+    traces.append(
         go.Scatter(
             x=x,
             y=y,
@@ -266,8 +253,9 @@ def _master_plot(
 
     # stats and title
     string = []
+    all_bss = stats.bootstrap_statistics(x, y, statistics=statistics)
     for statistic in statistics:
-        bss = stats.bootstrap_statistic(x, y, statistic=statistic)
+        bss = all_bss[statistic]
 
         string.append(
             f"{statistic + ':':5s}{bss['mle']:5.2f} [95%: {bss['low']:5.2f}, {bss['high']:5.2f}]"
@@ -277,7 +265,7 @@ def _master_plot(
     long_title = f"{title}<br>{target_name} (N = {nsamples})<br>{stats_string}"
 
     # figure layout
-    fig.update_layout(
+    layout = go.Layout(
         title=dict(
             text=long_title,
             font_family="monospace",
@@ -298,7 +286,8 @@ def _master_plot(
             range=(ax_min, ax_max),
         ),
         width=400,
-        height=400
+        height=400,
+        shapes=shapes,
         #         legend=dict(
         #             x=1.0,
         #             y=1.0,
@@ -307,10 +296,6 @@ def _master_plot(
         #             font_size=12
         #         )
     )
+    fig = go.Figure(data=traces, layout=layout)
 
-    if filename is None:
-        fig.show()
-    elif filename.find(".html") > 0:
-        fig.write_html(filename)
-    else:
-        fig.write_image(filename)
+    _dispatch_plotly(fig, filename)
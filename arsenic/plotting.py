@@ -1,4 +1,3 @@
-import itertools
 from typing import Union
 import matplotlib.pylab as plt
 import numpy as np
@@ -6,6 +5,14 @@ import networkx as nx
 from . import plotlying, stats
 
 
+def _dispatch_mpl(filename: Union[str, None] = None):
+    """Shows the current matplotlib figure if filename is None, otherwise saves it to filename"""
+    if filename is None:
+        plt.show()
+    else:
+        plt.savefig(filename, bbox_inches="tight")
+
+
 def _master_plot(
     x: np.ndarray,
     y: np.ndarray,
@@ -86,8 +93,8 @@ def _master_plot(
     plt.xlabel(f"{xlabel} {quantity} / " + units)
     plt.ylabel(f"{ylabel} {quantity} / " + units)
 
-    ax_min = min(min(x), min(y)) - 0.5
-    ax_max = max(max(x), max(y)) + 0.5
+    ax_min = min(np.min(x), np.min(y)) - 0.5
+    ax_max = max(np.max(x), np.max(y)) + 0.5
     scale = [ax_min, ax_max]
 
     plt.xlim(scale)
@@ -118,12 +125,17 @@ def _master_plot(
             alpha=0.2,
         )
     # actual plotting
-    cm = plt.get_cmap("coolwarm")
-
     if color is None:
-        color = np.abs(x - y)
         # 2.372 kcal / mol = 4 RT
-        color = cm(color / 2.372)
+        # left as scalars for scatter to map through the colormap, rather than as RGBA
+        colors = dict(
+            c=np.clip(np.abs(x - y) * (1.0 / 2.372), 0.0, 1.0),
+            cmap="coolwarm",
+            vmin=0.0,
+            vmax=1.0,
+        )
+    else:
+        colors = dict(color=color)
     plt.errorbar(
         x,
         y,
@@ -134,12 +146,13 @@ def _master_plot(
         elinewidth=2.0,
         zorder=1,
     )
-    plt.scatter(x, y, color=color, s=10, marker="o", zorder=2)
+    plt.scatter(x, y, s=10, marker="o", zorder=2, **colors)
 
     # stats and title
     statistics_string = ""
+    bss = stats.bootstrap_statistics(x, y, xerr, yerr, statistics=statistics)
     for statistic in statistics:
-        s = stats.bootstrap_statistic(x, y, xerr, yerr, statistic=statistic)
+        s = bss[statistic]
         string = f"{statistic}:   {s['mle']:.2f} [95%: {s['low']:.2f}, {s['high']:.2f}] " + "\n"
         statistics_string += string
 
@@ -153,13 +166,59 @@ def _master_plot(
         family="monospace",
     )
 
-    if filename is None:
-        plt.show()
-    else:
-        plt.savefig(filename, bbox_inches="tight")
+    _dispatch_mpl(filename)
     return fig
 
 
+def _prepare_DDG_arrays(graph: nx.DiGraph, map_positive: bool = False, symmetrise: bool = False):
+    """Collects the relative free energies and their errors from the graph edges,
+    mapped or symmetrised as requested by `plot_DDGs`
+
+    Parameters
+    ----------
+    graph : nx.DiGraph
+        graph object with relative free energy edges
+    map_positive : bool, default=False
+        whether to map all DDGs to the positive x values
+    symmetrise : bool, default = False
+        whether to return each datapoint twice, both
+        positive and negative
+
+    Returns
+    -------
+    x_data, y_data, xerr, yerr : np.ndarray
+        experimental and calculated DDGs, and their errors
+
+    """
+    # single pass over the edges, filling preallocated arrays
+    n_edges = graph.number_of_edges()
+    x = np.empty(n_edges)
+    y = np.empty(n_edges)
+    xerr = np.empty(n_edges)
+    yerr = np.empty(n_edges)
+    for i, (_, _, edge) in enumerate(graph.edges(data=True)):
+        x[i] = edge["exp_DDG"]
+        y[i] = edge["calc_DDG"]
+        xerr[i] = edge["exp_dDDG"]
+        yerr[i] = edge["calc_dDDG"]
+
+    if symmetrise:
+        x_data = np.append(x, -x)
+        y_data = np.append(y, -y)
+        xerr = np.append(xerr, xerr)
+        yerr = np.append(yerr, yerr)
+    elif map_positive:
+        # flip the edges with a negative experimental DDG
+        sign = np.where(x < 0, -1.0, 1.0)
+        x_data = x * sign
+        y_data = y * sign
+    else:
+        x_data = x
+        y_data = y
+
+    return x_data, y_data, xerr, yerr
+
+
 def plot_DDGs(
     graph: nx.DiGraph,
     method_name: str = "",
@@ -201,34 +260,7 @@ def plot_DDGs(
         int(symmetrise) + int(map_positive) != 2
     ), "Symmetrise and map_positive cannot both be True in the same plot"
 
-    # data
-    x = [x[2]["exp_DDG"] for x in graph.edges(data=True)]
-    y = [x[2]["calc_DDG"] for x in graph.edges(data=True)]
-
-    if symmetrise:
-        x_data = np.append(x, [-i for i in x])
-        y_data = np.append(y, [-i for i in y])
-    elif map_positive:
-        x_data = []
-        y_data = []
-        for i, j in zip(x, y):
-            if i < 0:
-                x_data.append(-i)
-                y_data.append(-j)
-            else:
-                x_data.append(i)
-                y_data.append(j)
-        x_data = np.asarray(x_data)
-        y_data = np.asarray(y_data)
-    else:
-        x_data = np.asarray(x)
-        y_data = np.asarray(y)
-
-    xerr = np.asarray([x[2]["exp_dDDG"] for x in graph.edges(data=True)])
-    yerr = np.asarray([x[2]["calc_dDDG"] for x in graph.edges(data=True)])
-    if symmetrise:
-        xerr = np.append(xerr, xerr)
-        yerr = np.append(yerr, yerr)
+    x_data, y_data, xerr, yerr = _prepare_DDG_arrays(graph, map_positive, symmetrise)
 
     if plotly:
         plotlying._master_plot(
@@ -291,16 +323,19 @@ def plot_DGs(
     """
 
     # data
-    x_data = np.asarray([node[1]["exp_DG"] for node in graph.nodes(data=True)])
-    y_data = np.asarray([node[1]["calc_DG"] for node in graph.nodes(data=True)])
-    xerr = np.asarray([node[1]["exp_dDG"] for node in graph.nodes(data=True)])
-    yerr = np.asarray([node[1]["calc_dDG"] for node in graph.nodes(data=True)])
+    nodes = list(graph.nodes(data=True))
+    n_nodes = len(nodes)
+    x_data = np.fromiter((node[1]["exp_DG"] for node in nodes), dtype=np.float64, count=n_nodes)
+    y_data = np.fromiter((node[1]["calc_DG"] for node in nodes), dtype=np.float64, count=n_nodes)
+    xerr = np.fromiter((node[1]["exp_dDG"] for node in nodes), dtype=np.float64, count=n_nodes)
+    yerr = np.fromiter((node[1]["calc_dDG"] for node in nodes), dtype=np.float64, count=n_nodes)
 
     # centralising
     # this should be replaced by providing one experimental result
+    # the arrays are freshly built above, so they can be shifted in place
     if centralizing == True:
-        x_data = x_data - np.mean(x_data) + shift
-        y_data = y_data - np.mean(y_data) + shift
+        x_data -= x_data.mean() - shift
+        y_data -= y_data.mean() - shift
 
     if plotly:
         plotlying._master_plot(
@@ -368,32 +403,26 @@ def plot_all_DDGs(
 
     """
 
-    nodes = graph.nodes(data=True)
+    nodes = list(graph.nodes(data=True))
+    n_nodes = len(nodes)
 
-    x_abs = np.asarray([node[1]["exp_DG"] for node in nodes])
-    y_abs = np.asarray([node[1]["calc_DG"] for node in nodes])
-    xabserr = np.asarray([node[1]["exp_dDG"] for node in nodes])
-    yabserr = np.asarray([node[1]["calc_dDG"] for node in nodes])
+    x_abs = np.fromiter((node[1]["exp_DG"] for node in nodes), dtype=np.float64, count=n_nodes)
+    y_abs = np.fromiter((node[1]["calc_DG"] for node in nodes), dtype=np.float64, count=n_nodes)
+    xabserr = np.fromiter((node[1]["exp_dDG"] for node in nodes), dtype=np.float64, count=n_nodes)
+    yabserr = np.fromiter((node[1]["calc_dDG"] for node in nodes), dtype=np.float64, count=n_nodes)
     # do all to plot_all
-    x_data = []
-    y_data = []
-    xerr = []
-    yerr = []
-    for a, b in itertools.combinations(range(len(x_abs)), 2):
-        x = x_abs[a] - x_abs[b]
-        x_data.append(x)
-        x_data.append(-x)
-        err = (xabserr[a] ** 2 + xabserr[b] ** 2) ** 0.5
-        xerr.append(err)
-        xerr.append(err)
-        y = y_abs[a] - y_abs[b]
-        y_data.append(y)
-        y_data.append(-y)
-        err = (yabserr[a] ** 2 + yabserr[b] ** 2) ** 0.5
-        yerr.append(err)
-        yerr.append(err)
-    x_data = np.asarray(x_data)
-    y_data = np.asarray(y_data)
+    # pairwise differences via broadcasting, keeping each unique pair (a < b) once
+    diff_x = x_abs[:, None] - x_abs[None, :]
+    diff_y = y_abs[:, None] - y_abs[None, :]
+    err_x = np.sqrt(xabserr[:, None] ** 2 + xabserr[None, :] ** 2)
+    err_y = np.sqrt(yabserr[:, None] ** 2 + yabserr[None, :] ** 2)
+    iu = np.triu_indices(len(x_abs), k=1)
+
+    # symmetrise, so each pair is plotted as both a->b and b->a
+    x_data = np.concatenate([diff_x[iu], -diff_x[iu]])
+    y_data = np.concatenate([diff_y[iu], -diff_y[iu]])
+    xerr = np.concatenate([err_x[iu], err_x[iu]])
+    yerr = np.concatenate([err_y[iu], err_y[iu]])
 
     if plotly:
         plotlying._master_plot(
@@ -422,3 +451,36 @@ def plot_all_DDGs(
             shift=shift,
             **kwargs,
         )
+
+
+def plot_many(
+    graphs: list,
+    filenames: list,
+    plot_function=plot_DDGs,
+    plotly: bool = True,
+    **kwargs,
+):
+    """Convenience function to make the same kind of plot for several graphs,
+    e.g. one per target or method, each written to its own file.
+
+    Parameters
+    ----------
+    graphs : list(nx.DiGraph)
+        graph objects to plot
+    filenames : list(str)
+        filename for the plot of each graph
+    plot_function : function, default = plot_DDGs
+        one of `plot_DDGs`, `plot_DGs` or `plot_all_DDGs`
+    plotly : bool, default = True
+        whether to use plotly for the plotting
+    **kwargs
+        passed on to plot_function for every graph
+
+    Returns
+    -------
+
+    """
+    assert len(graphs) == len(filenames), "Need one filename per graph"
+
+    for graph, filename in zip(graphs, filenames):
+        plot_function(graph, filename=filename, plotly=plotly, **kwargs)
@@ -4,6 +4,11 @@ import scipy
 import sklearn.metrics
 from typing import Union
 
+# statistics that _batched_statistic computes for all bootstrap samples at once
+_BATCHED_STATISTICS = ["RMSE", "MUE", "R2", "rho"]
+# number of bootstrap samples drawn and evaluated together in bootstrap_statistics
+_BOOTSTRAP_CHUNK_SIZE = 100
+
 
 def bootstrap_statistic(
     y_true: np.ndarray,
@@ -45,6 +50,58 @@ def bootstrap_statistic(
         'low' : low end of CI
         'high' : high end of CI
     """
+    return bootstrap_statistics(
+        y_true,
+        y_pred,
+        dy_true,
+        dy_pred,
+        ci=ci,
+        statistics=[statistic],
+        nbootstrap=nbootstrap,
+        plot_type=plot_type,
+    )[statistic]
+
+
+def bootstrap_statistics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    dy_true: Union[np.ndarray, None] = None,
+    dy_pred: Union[np.ndarray, None] = None,
+    ci: float = 0.95,
+    statistics: list = ["RMSE", "MUE"],
+    nbootstrap: int = 1000,
+    plot_type: str = "dG",
+) -> dict:
+
+    """Compute mean and confidence intervals of several statistics,
+    sharing one set of bootstrap samples between all of them.
+
+    Parameters
+    ----------
+    y_true : ndarray with shape (N,)
+        True values
+    y_pred : ndarray with shape (N,)
+        Predicted values
+    dy_true : ndarray with shape (N,) or None
+        Errors of true values. If None, the values are assumed to have no errors
+    dy_pred : ndarray with shape (N,) or None
+        Errors of predicted values. If None, the values are assumed to have no errors
+    ci : float, optional, default=0.95
+        Interval for confidence interval (CI)
+    statistics : list(str), default = ['RMSE',  'MUE']
+        Statistics, each one of ['RMSE', 'MUE', 'R2', 'rho','KTAU','RAE']
+    nbootstrap : int, optional, default=1000
+        Number of bootstrap samples
+    plot_type : str, optional, default='dG'
+        'dG' or 'ddG'
+
+    Returns
+    -------
+    all_stats : dict of dict
+        for each requested statistic, a dict of float with
+        'mle', 'mean', 'stderr', 'low' and 'high', as returned
+        by `bootstrap_statistic`
+    """
 
     def compute_statistic(y_true_sample: np.ndarray, y_pred_sample: np.ndarray, statistic: str):
         """Compute requested statistic.
@@ -97,39 +154,94 @@ def bootstrap_statistic(
         N = len(x)
         return np.array([(x[i] - x[j]) for i in range(N) for j in range(N) if (i != j)])
 
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
     if dy_true is None:
         dy_true = np.zeros_like(y_true)
     if dy_pred is None:
         dy_pred = np.zeros_like(y_pred)
+    dy_true = np.asarray(dy_true)
+    dy_pred = np.asarray(dy_pred)
     assert len(y_true) == len(y_pred)
     assert len(y_true) == len(dy_true)
     assert len(y_true) == len(dy_pred)
     sample_size = len(y_true)
+
     s_n = np.zeros(
-        [nbootstrap], np.float64
-    )  # s_n[n] is the statistic computed for bootstrap sample n
-    for replicate in range(nbootstrap):
-        y_true_sample = np.zeros_like(y_true)
-        y_pred_sample = np.zeros_like(y_pred)
-        for i, j in enumerate(
-            np.random.choice(np.arange(sample_size), size=[sample_size], replace=True)
-        ):
-            y_true_sample[i] = np.random.normal(loc=y_true[j], scale=np.fabs(dy_true[j]), size=1)
-            y_pred_sample[i] = np.random.normal(loc=y_pred[j], scale=np.fabs(dy_pred[j]), size=1)
-        s_n[replicate] = compute_statistic(y_true_sample, y_pred_sample, statistic)
-
-    rmse_stats = dict()
-    rmse_stats["mle"] = compute_statistic(y_true, y_pred, statistic)
-    rmse_stats["stderr"] = np.std(s_n)
-    rmse_stats["mean"] = np.mean(s_n)
-    # TODO: Is there a canned method to do this?
-    s_n = np.sort(s_n)
+        [len(statistics), nbootstrap], np.float64
+    )  # s_n[k, n] is statistic k computed for bootstrap sample n
+
+    # draw the bootstrap samples in blocks of rows, so memory stays O(chunk * N)
+    # rather than O(nbootstrap * N), row n of a block being sample start + n
+    for start in range(0, nbootstrap, _BOOTSTRAP_CHUNK_SIZE):
+        stop = min(start + _BOOTSTRAP_CHUNK_SIZE, nbootstrap)
+        indices = np.random.choice(
+            np.arange(sample_size), size=[stop - start, sample_size], replace=True
+        )
+        y_true_samples = np.random.normal(loc=y_true[indices], scale=np.fabs(dy_true[indices]))
+        y_pred_samples = np.random.normal(loc=y_pred[indices], scale=np.fabs(dy_pred[indices]))
+
+        for k, statistic in enumerate(statistics):
+            if statistic in _BATCHED_STATISTICS:
+                s_n[k, start:stop] = _batched_statistic(y_true_samples, y_pred_samples, statistic)
+            else:
+                for i, replicate in enumerate(range(start, stop)):
+                    s_n[k, replicate] = compute_statistic(
+                        y_true_samples[i], y_pred_samples[i], statistic
+                    )
+
     low_frac = (1.0 - ci) / 2.0
     high_frac = 1.0 - low_frac
-    rmse_stats["low"] = s_n[int(np.floor(nbootstrap * low_frac))]
-    rmse_stats["high"] = s_n[int(np.ceil(nbootstrap * high_frac))]
+    all_stats = dict()
+    for k, statistic in enumerate(statistics):
+        rmse_stats = dict()
+        rmse_stats["mle"] = compute_statistic(y_true, y_pred, statistic)
+        rmse_stats["stderr"] = np.std(s_n[k])
+        rmse_stats["mean"] = np.mean(s_n[k])
+        # TODO: Is there a canned method to do this?
+        s_k = np.sort(s_n[k])
+        rmse_stats["low"] = s_k[int(np.floor(nbootstrap * low_frac))]
+        rmse_stats["high"] = s_k[int(np.ceil(nbootstrap * high_frac))]
+        all_stats[statistic] = rmse_stats
+
+    return all_stats
+
+
+def _batched_statistic(
+    y_true_samples: np.ndarray, y_pred_samples: np.ndarray, statistic: str
+) -> np.ndarray:
+    """Compute a statistic for every row of a set of bootstrap samples at once.
+
+    Parameters
+    ----------
+    y_true_samples : ndarray with shape (nbootstrap, N)
+        True values, one bootstrap sample per row
+    y_pred_samples : ndarray with shape (nbootstrap, N)
+        Predicted values, one bootstrap sample per row
+    statistic : str
+        Statistic, one of ['RMSE', 'MUE', 'R2', 'rho']
 
-    return rmse_stats
+    Returns
+    -------
+    s_n : ndarray with shape (nbootstrap,)
+        s_n[n] is the statistic computed for bootstrap sample n
+    """
+    if statistic == "RMSE":
+        return np.sqrt(np.mean((y_true_samples - y_pred_samples) ** 2, axis=1))
+    elif statistic == "MUE":
+        return np.mean(np.abs(y_true_samples - y_pred_samples), axis=1)
+    elif statistic in ["R2", "rho"]:
+        # Pearson correlation of each row, R2 being the square of it as from linregress
+        true_centred = y_true_samples - y_true_samples.mean(axis=1, keepdims=True)
+        pred_centred = y_pred_samples - y_pred_samples.mean(axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            r = np.sum(true_centred * pred_centred, axis=1) / np.sqrt(
+                np.sum(true_centred**2, axis=1) * np.sum(pred_centred**2, axis=1)
+            )
+        r = np.clip(r, -1.0, 1.0)
+        return r**2 if statistic == "R2" else r
+    else:
+        raise Exception("unknown statistic '{}'".format(statistic))
 
 
 def mle(
@@ -0,0 +1,14 @@
+from arsenic import plotting
+
+
+def test_plot_many(fe_map, tmp_path):
+    """
+    Test that plot_many writes one plot per graph to the given filenames
+    """
+    filenames = [str(tmp_path / "first.html"), str(tmp_path / "second.html")]
+
+    plotting.plot_many([fe_map.graph, fe_map.graph], filenames, plot_function=plotting.plot_DGs)
+
+    for filename in filenames:
+        with open(filename) as f:
+            assert "<html>" in f.read(), f"{filename} is not a plotly html file"
@@ -145,3 +145,78 @@ def test_correlation_positive(fe_map):
         assert (
             0.5 < bss["mle"] < 0.9
         ), f"Correlation must be positive for this data. {stat} is {bss['mle']}"
+
+
+def test_bootstrap_statistics_matches_single(fe_map):
+    """
+    Test that computing several statistics from one set of bootstrap
+    samples agrees with computing each one separately from the same
+    random state
+    """
+
+    nodes = fe_map.graph.nodes
+
+    x_data = np.asarray([n[1]["exp_DG"] for n in nodes(data=True)])
+    y_data = np.asarray([n[1]["calc_DG"] for n in nodes(data=True)])
+    xerr = np.asarray([n[1]["exp_dDG"] for n in nodes(data=True)])
+    yerr = np.asarray([n[1]["calc_dDG"] for n in nodes(data=True)])
+
+    statistics = ["RMSE", "MUE"]
+    np.random.seed(0)
+    all_bss = stats.bootstrap_statistics(x_data, y_data, xerr, yerr, statistics=statistics)
+    assert list(all_bss.keys()) == statistics
+
+    np.random.seed(0)
+    bss = bootstrap_statistic(x_data, y_data, xerr, yerr, statistic="RMSE")
+    for key in ["mean", "low", "high", "stderr"]:
+        assert np.isclose(
+            all_bss["RMSE"][key], bss[key]
+        ), f"Shared bootstrap RMSE {key} differs from the single statistic"
+
+    for stat in statistics:
+        s = all_bss[stat]
+        assert (
+            np.abs(s["mean"] - s["mle"]) < 3.0 * s["stderr"]
+        ), f"Bootstrap mean of {stat} is too far from its MLE"
+
+
+def test_batched_statistic():
+    """
+    Test that the statistics computed over all bootstrap samples at once
+    agree with computing them one sample at a time
+    """
+    import scipy.stats
+    import sklearn.metrics
+
+    y_true_samples = np.random.normal(size=(20, 10))
+    y_pred_samples = y_true_samples + np.random.normal(scale=0.5, size=(20, 10))
+
+    single = {
+        "RMSE": lambda t, p: np.sqrt(sklearn.metrics.mean_squared_error(t, p)),
+        "MUE": sklearn.metrics.mean_absolute_error,
+        "R2": lambda t, p: scipy.stats.linregress(t, p)[2] ** 2,
+        "rho": lambda t, p: scipy.stats.pearsonr(t, p)[0],
+    }
+    for stat, func in single.items():
+        batched = stats._batched_statistic(y_true_samples, y_pred_samples, stat)
+        expected = [func(t, p) for t, p in zip(y_true_samples, y_pred_samples)]
+        assert np.allclose(batched, expected), f"Batched {stat} differs from per-sample {stat}"
+
+
+def test_bootstrap_statistics_partial_chunk():
+    """
+    Test that every bootstrap sample is filled in when nbootstrap is not
+    a multiple of the number of samples drawn at once
+    """
+    nbootstrap = 2 * stats._BOOTSTRAP_CHUNK_SIZE + stats._BOOTSTRAP_CHUNK_SIZE // 2
+
+    y_true = np.linspace(-5.0, 5.0, 30)
+    y_pred = y_true + np.random.normal(scale=0.5, size=30)
+    dy = np.full(30, 0.2)
+
+    all_bss = stats.bootstrap_statistics(
+        y_true, y_pred, dy, dy, statistics=["RMSE", "KTAU"], nbootstrap=nbootstrap
+    )
+    for stat, bss in all_bss.items():
+        # unfilled samples would be left at zero, dragging the low end of the CI to zero
+        assert 0 < bss["low"] <= bss["high"], f"Some {stat} bootstrap samples were not computed"